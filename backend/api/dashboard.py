@@ -1,13 +1,12 @@
 # router module (e.g., backend/dashboard.py)
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from fastapi.responses import FileResponse
 from bson import ObjectId
-from jose import jwt, JWTError
-from fastapi.security import OAuth2PasswordBearer
-from dotenv import load_dotenv
 import os
 
 from db import images_collection, edits_collection
+from auth.deps import get_current_user
+from utils.responses import UTCORJSONResponse
 
 router = APIRouter()
 
@@ -19,65 +18,76 @@ STATIC_DIR = "static"
 UPLOAD_DIR = os.path.join(STATIC_DIR, "uploads")
 EDIT_DIR = os.path.join(STATIC_DIR, "processed")
 
-# ----- Auth config (JWT) -----
-# Load env variables from .env in local dev; in production, envs come from the platform.
-load_dotenv()
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = "HS256"
+# Page size bounds for the image listing
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
 
-# The tokenUrl here is used by Swagger's "Authorize" button only.
-# It does not affect validation logic—just the docs OAuth flow.
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-# Base URL used to build fully-qualified links returned in JSON responses below.
-# In local dev this points to your Uvicorn server; for prod you can:
-#   - leave BASE_URL and return relative paths (frontends prepend their origin), OR
-#   - set it via env (e.g., API_BASE_URL) and compose absolute URLs.
-BASE_URL = "http://localhost:8000"  # Change in production
-
-
-# ----- Helper: extract current user id from JWT -----
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
+# ----- Helper: serve a file from local storage -----
+def file_response(filepath: str, media_type: str, filename: str) -> FileResponse:
+    # Stat once and hand the result to FileResponse: it reuses it for
+    # Content-Length/Last-Modified/ETag instead of stat-ing the file again.
+    # A missing file surfaces here as a 404 (no separate exists() check).
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")  # we expect "sub" to contain the user's ObjectId string
-        if not user_id:
-            raise HTTPException(status_code=401, detail="Invalid token payload")
-        return user_id
-    except JWTError:
-        # Any decode/expiry/signature error → unauthorized
-        raise HTTPException(status_code=401, detail="Invalid token")
+        stat_result = os.stat(filepath)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+    return FileResponse(filepath, media_type=media_type, filename=filename, stat_result=stat_result)
 
 
-# ----- Fetch all images for a given user (public endpoint taking user_id path param) -----
+# ----- Fetch a page of images for a given user (public endpoint taking user_id path param) -----
+# Newest first. Page with ?skip=&limit=; the X-Has-More response header ("true"/"false")
+# tells the client whether another page exists (no count_documents needed).
 @router.get("/user-images/{user_id}")
-async def get_user_images_by_id(user_id: str):
+async def get_user_images_by_id(
+    user_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
     # Validate and convert the provided user_id to ObjectId
     try:
         user_object_id = ObjectId(user_id)
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid user ID")
 
-    # Query images owned by that user
-    images_cursor = images_collection.find({"user_id": user_object_id})
-    images = []
-
-    # For each image, try to find a corresponding edit document
-    async for image in images_cursor:
-        edit = await edits_collection.find_one({"image_id": image["_id"]})
-
-        # Build response fields; original/edited URLs are assembled against BASE_URL
-        images.append({
-            "id": str(image["_id"]),
-            "name": image.get("filename", "Unnamed"),
-            "originalImageUrl": f"http://localhost:8000{image.get('original_url')}",
-            "editedImageUrl": f"http://localhost:8000{edit.get('edited_url')}" if edit else None,
+    # One aggregation instead of a find_one per image:
+    # join each image with its edit documents and shape the response in Mongo.
+    pipeline = [
+        {"$match": {"user_id": user_object_id}},
+        # _id breaks ties so pages stay stable when uploaded_at values are equal
+        {"$sort": {"uploaded_at": -1, "_id": -1}},
+        {"$skip": skip},
+        # Fetch one extra document to know whether there's a next page
+        {"$limit": limit + 1},
+        # Only carry the fields the response needs into the join
+        {"$project": {"filename": 1, "original_url": 1, "uploaded_at": 1}},
+        {"$lookup": {
+            "from": edits_collection.name,
+            "localField": "_id",
+            "foreignField": "image_id",
+            "as": "edit",
+        }},
+        # Keep the first edit only (same as the old find_one); images without edits get null
+        {"$addFields": {"edit": {"$arrayElemAt": ["$edit", 0]}}},
+        {"$project": {
+            "_id": 0,
+            "id": {"$toString": "$_id"},
+            "name": {"$ifNull": ["$filename", "Unnamed"]},
+            # Original/edited URLs are relative (/static/...); the frontend prepends the API origin
+            "originalImageUrl": {"$ifNull": ["$original_url", None]},
+            "editedImageUrl": {"$ifNull": ["$edit.edited_url", None]},
             # Use uploaded_at if present; otherwise fallback to edited_at if we have an edit doc
-            "createdAt": image.get("uploaded_at") or (edit.get("edited_at") if edit else None),
-            "editType": edit.get("edit_type") if edit else None
-        })
+            "createdAt": {"$ifNull": ["$uploaded_at", {"$ifNull": ["$edit.edited_at", None]}]},
+            "editType": {"$ifNull": ["$edit.edit_type", None]},
+        }},
+    ]
 
-    return images
+    images = [doc async for doc in images_collection.aggregate(pipeline)]
+
+    # Return the response directly: the docs are already JSON-ready (ids are strings,
+    # datetimes are handled by orjson), so skip FastAPI's jsonable_encoder pass
+    has_more = len(images) > limit
+    return UTCORJSONResponse(images[:limit], headers={"X-Has-More": "true" if has_more else "false"})
 
 
 # ----- Delete an image (auth required) -----
@@ -127,10 +137,7 @@ async def download_edited_image(image_id: str, current_user: str = Depends(get_c
     filename = edit["edited_url"].split("/")[-1]
     filepath = os.path.join(EDIT_DIR, filename)
 
-    if not os.path.exists(filepath):
-        raise HTTPException(status_code=404, detail="File not found")
-
-    return FileResponse(filepath, media_type="image/jpeg", filename=filename)
+    return file_response(filepath, media_type="image/jpeg", filename=filename)
 
 
 # ----- Download the original uploaded image (auth required) -----
@@ -152,7 +159,4 @@ async def download_original_image(image_id: str, current_user: str = Depends(get
     filename = image["filename"]
     filepath = os.path.join(UPLOAD_DIR, filename)
 
-    if not os.path.exists(filepath):
-        raise HTTPException(status_code=404, detail="File not found")
-
-    return FileResponse(filepath, media_type="image/png", filename=filename)
+    return file_response(filepath, media_type="image/png", filename=filename)
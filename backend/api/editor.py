@@ -1,43 +1,17 @@
 # backend/api/editor.py
-from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Depends
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from bson import ObjectId
 from datetime import datetime
-import shutil, os
-from jose import JWTError, jwt
-from fastapi.security import OAuth2PasswordBearer
-from dotenv import load_dotenv
+import asyncio
 import os
+import aiofiles
 
-from db import images_collection, edits_collection
-from utils.image_ai import process_image
-
-# Load environment variables (for local dev; in production, the platform sets envs)
-load_dotenv()
+from config import UPLOAD_CHUNK_SIZE
+from db import images_collection, edits_collection, variations_collection
+from utils.image_ai import process_image, variation_cache_key, copy_cached_output
 
 router = APIRouter()
 
-# -------------------- Auth / JWT config --------------------
-# SECRET_KEY is used to verify JWTs created at login.
-# Make sure SECRET_KEY is set in your environment (not hardcoded).
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = "HS256"
-
-# This defines how Swagger's "Authorize" flow gets a token.
-# Note: tokenUrl affects docs UX only; decode logic below enforces auth at runtime.
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
-
-# Extract current user ID ("sub") from the bearer token.
-async def get_current_user(token: str = Depends(oauth2_scheme)):
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(status_code=401, detail="Invalid token payload")
-        return user_id
-    except JWTError:
-        # Any error (expired/invalid/signature) → unauthorized
-        raise HTTPException(status_code=401, detail="Invalid token")
-
 # -------------------- Local file storage paths --------------------
 # Files are saved under ./static. In containerized cloud (App Runner/ECS),
 # this storage is ephemeral (lost on restart/scale). For production durability,
@@ -50,6 +24,34 @@ EDIT_DIR = os.path.join(STATIC_DIR, "processed")
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 os.makedirs(EDIT_DIR, exist_ok=True)
 
+# -------------------- Helper: in-kernel copy of a spooled upload --------------------
+def save_with_sendfile(src, dst_path: str) -> bool:
+    """
+    Copy an upload that has spilled to a temp file on disk into dst_path with
+    os.sendfile (file -> file inside the kernel, no user-space buffers).
+    Returns False when that isn't possible: upload still in memory, no
+    os.sendfile (Windows), or a platform that only sends to sockets (macOS).
+    """
+    # SpooledTemporaryFile.fileno() would force an in-memory upload to disk,
+    # so only use it once the file has already rolled over
+    if not hasattr(os, "sendfile") or not getattr(src, "_rolled", False):
+        return False
+
+    src_fd = src.fileno()
+    size = os.fstat(src_fd).st_size
+    try:
+        with open(dst_path, "wb") as dst:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src_fd, offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+    except OSError:
+        return False
+    return True
+
+
 # -------------------- Upload an image --------------------
 @router.post("/upload")
 async def upload_image(
@@ -66,9 +68,14 @@ async def upload_image(
     filename = file.filename
     upload_path = os.path.join(UPLOAD_DIR, filename)
 
+    # Large uploads (already on disk) are copied in-kernel with sendfile; otherwise
+    # stream in chunks with async I/O so the upload doesn't block the event loop
     try:
-        with open(upload_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        if not await asyncio.to_thread(save_with_sendfile, file.file, upload_path):
+            await file.seek(0)
+            async with aiofiles.open(upload_path, "wb") as buffer:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    await buffer.write(chunk)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"File save failed: {str(e)}")
 
@@ -119,8 +126,24 @@ async def edit_image(
     output_filename = f"{ObjectId()}.jpg"  # unique filename for the edited result
     output_path = os.path.join(EDIT_DIR, output_filename)
 
-    # Perform the edit (your implementation in utils.image_ai.process_image)
-    process_image(input_path, output_path, edit_type, intensity)
+    # Reuse an earlier result for the same input bytes + settings (skips the OpenAI call)
+    cache_key = await asyncio.to_thread(variation_cache_key, input_path, edit_type, intensity)
+    cached = await variations_collection.find_one({"_id": cache_key})
+    reused = cached is not None and await asyncio.to_thread(
+        copy_cached_output, os.path.join(EDIT_DIR, cached["output_filename"]), output_path
+    )
+
+    if not reused:
+        # Perform the edit (your implementation in utils.image_ai.process_image).
+        # It makes blocking HTTP calls and file writes, so run it in a worker thread.
+        await asyncio.to_thread(process_image, input_path, output_path, edit_type, intensity)
+
+        # Remember the result; upsert replaces stale entries whose file is gone
+        await variations_collection.update_one(
+            {"_id": cache_key},
+            {"$set": {"output_filename": output_filename, "created_at": datetime.utcnow()}},
+            upsert=True,
+        )
 
     # Save edit metadata (linking edited file to the original image)
     edit_doc = {
@@ -1,17 +1,29 @@
 ﻿# backend/app.py
-import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from config import ALLOWED_ORIGINS
+from utils.responses import UTCORJSONResponse
+
 # Import routers (auth & API endpoints)
 from auth import signup, login
 from api import editor, dashboard
+from db import ensure_indexes
 
 # --------------------------------------------------------
 # Create the FastAPI application instance
 # --------------------------------------------------------
-app = FastAPI()
+# orjson is a C JSON encoder; much faster than the stdlib json module for list responses
+app = FastAPI(default_response_class=UTCORJSONResponse)
+
+# --------------------------------------------------------
+# Startup: make sure MongoDB indexes exist
+# --------------------------------------------------------
+# create_index is idempotent, so running this on every boot is safe.
+@app.on_event("startup")
+async def create_indexes():
+    await ensure_indexes()
 
 # --------------------------------------------------------
 # CORS configuration
@@ -21,16 +33,15 @@ app = FastAPI()
 #   "http://localhost:5173,https://username.github.io,https://username.github.io/repo"
 # - In local dev: set ALLOWED_ORIGINS=http://localhost:5173
 # - In production: set ALLOWED_ORIGINS to your GitHub Pages (or custom domain) URLs
-_env_origins = os.getenv("ALLOWED_ORIGINS")
-allowed_origins = [o.strip() for o in _env_origins.split(",")] if _env_origins else []
-
 # Attach the CORS middleware so browsers can call the API from the frontend
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=allowed_origins,
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let the frontend read the dashboard's pagination header
+    expose_headers=["X-Has-More"],
 )
 
 # --------------------------------------------------------
@@ -0,0 +1,52 @@
+# backend/auth/deps.py
+from fastapi import Depends, HTTPException
+from fastapi.security import OAuth2PasswordBearer
+import jwt
+from cachetools import TLRUCache
+import hashlib
+import time
+
+from config import SECRET_KEY, ALGORITHM
+
+# -------------------- Auth config --------------------
+# For Swagger's "Authorize" button (OAuth2 password flow)
+# tokenUrl points to the login endpoint, including the /api prefix used in app.py
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")
+
+# -------------------- Decoded-token cache --------------------
+# Skips jwt.decode for tokens we've already verified recently.
+# Key: blake2b digest of the raw token (never store the token itself).
+# Value: (user_id, exp). Each entry lives at most TOKEN_CACHE_TTL seconds
+# and never past the token's own expiry.
+TOKEN_CACHE_TTL = 60
+_token_cache = TLRUCache(
+    maxsize=10_000,
+    ttu=lambda _key, value, now: min(now + TOKEN_CACHE_TTL, value[1]),
+    timer=time.time,
+)
+
+
+# -------------------- Shared dependency for protected routes --------------------
+async def get_current_user(token: str = Depends(oauth2_scheme)) -> str:
+    """
+    Dependency you can add to any protected endpoint:
+      current_user: str = Depends(get_current_user)
+    It decodes the bearer token and returns the user id ('sub').
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached:
+        return cached[0]
+
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except jwt.PyJWTError:
+        # Any decode/expiry/signature error → unauthorized
+        raise HTTPException(status_code=401, detail="Invalid token")
+
+    user_id = payload.get("sub")  # we expect "sub" to contain the user's ObjectId string
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Invalid token payload")
+
+    _token_cache[key] = (user_id, payload.get("exp", time.time() + TOKEN_CACHE_TTL))
+    return user_id
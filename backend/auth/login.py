@@ -1,30 +1,40 @@
 # backend/auth/login.py
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jose import JWTError, jwt
-from dotenv import load_dotenv
+from fastapi.security import OAuth2PasswordRequestForm
+import jwt
+from cachetools import TTLCache
 from datetime import datetime, timedelta
-import os
+import asyncio
 
+from config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
 from db import users_collection
 from models.user import AuthResponse
 from utils.security import verify_password
 
-# Load env vars from .env during local dev; in prod, the platform supplies them
-load_dotenv()
-
 router = APIRouter()
 
-# -------------------- JWT / Auth config --------------------
-# SECRET_KEY signs the JWT; keep it in an environment variable (never hardcode).
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = "HS256"
-# Token lifetime: 7 days (in minutes)
-ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7
+# -------------------- User lookup cache --------------------
+# Repeated login attempts for the same email (retries, typos, brute force) reuse
+# the user doc instead of hitting Mongo each time. Only existing users are cached,
+# and only the fields login needs. TTL is short so changes/revocations apply quickly.
+_user_cache = TTLCache(maxsize=2000, ttl=30)
+
+
+async def find_user_by_email(email: str):
+    user = _user_cache.get(email)
+    if user is None:
+        user = await users_collection.find_one(
+            {"email": email}, {"email": 1, "password_hash": 1}
+        )
+        if user:
+            _user_cache[email] = user
+    return user
+
+
+def invalidate_cached_user(email: str):
+    # Call whenever a user's email/password changes so login sees it immediately
+    _user_cache.pop(email, None)
 
-# For Swagger's "Authorize" button (OAuth2 password flow)
-# tokenUrl should point to this router's login endpoint, including the /api prefix used in app.py
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/login")
 
 # -------------------- Login endpoint --------------------
 @router.post("/login", response_model=AuthResponse)
@@ -36,9 +46,10 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
     Returns AuthResponse with email, id, and JWT if credentials are valid.
     """
     # Look up the user by email
-    user = await users_collection.find_one({"email": form_data.username})
-    # Check user exists AND password matches (using your bcrypt-based helper)
-    if not user or not verify_password(form_data.password, user["password_hash"]):
+    user = await find_user_by_email(form_data.username)
+    # Check user exists AND password matches (using your bcrypt-based helper).
+    # bcrypt is CPU-bound, so run it in a worker thread to keep the event loop free.
+    if not user or not await asyncio.to_thread(verify_password, form_data.password, user["password_hash"]):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     # Create JWT payload with subject (user id) and expiry
@@ -57,19 +68,3 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
         "id": user_id,
         "token": token
     }
-
-# -------------------- Optional helper for protected routes --------------------
-async def get_current_user(token: str = Depends(oauth2_scheme)):
-    """
-    Dependency you can add to any protected endpoint:
-      current_user: str = Depends(get_current_user)
-    It decodes the bearer token and returns the user id ('sub').
-    """
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise HTTPException(status_code=401, detail="Invalid token payload")
-        return user_id
-    except JWTError:
-        raise HTTPException(status_code=401, detail="Invalid token")
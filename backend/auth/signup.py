@@ -1,25 +1,19 @@
 # backend/auth/signup.py
 from fastapi import APIRouter, HTTPException
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
-import os
-from jose import jwt
+import asyncio
+import jwt
 
+from config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
 from db import users_collection
+from auth.login import invalidate_cached_user
 from models.user import AuthRequest, AuthResponse
 from utils.security import hash_password
 
-# Load env vars (for local dev); in production, AWS provides env directly
-load_dotenv()
-
 router = APIRouter()
 
-# -------------------- JWT Config --------------------
-SECRET_KEY = os.getenv("SECRET_KEY")     # never hardcode; set as env var
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 1 week lifetime
-
 # -------------------- Signup endpoint --------------------
 @router.post("/signup", response_model=AuthResponse)
 async def signup(data: AuthRequest):
@@ -36,8 +30,9 @@ async def signup(data: AuthRequest):
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    # Hash password before storing (bcrypt, defined in utils.security)
-    hashed = hash_password(data.password)
+    # Hash password before storing (bcrypt, defined in utils.security).
+    # Run in a worker thread so the CPU-bound hash doesn't block the event loop.
+    hashed = await asyncio.to_thread(hash_password, data.password)
 
     # Construct user document for Mongo
     user = {
@@ -47,8 +42,13 @@ async def signup(data: AuthRequest):
         "created_at": datetime.utcnow()
     }
 
-    # Insert user document
-    result = await users_collection.insert_one(user)
+    # Insert user document. The unique index on email (db.ensure_indexes) catches
+    # a concurrent signup that slipped past the check above.
+    try:
+        result = await users_collection.insert_one(user)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    invalidate_cached_user(data.email)
     user_id = str(result.inserted_id)
 
     # Generate JWT token for immediate login after signup
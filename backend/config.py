@@ -0,0 +1,42 @@
+# backend/config.py
+import os
+from dotenv import load_dotenv
+
+# Load .env file in local development (ignored in production if not present).
+# This is the only place .env is read; every other module imports its settings from here.
+load_dotenv()
+
+# -------------------- JWT / Auth --------------------
+# SECRET_KEY signs and verifies JWTs; keep it in an environment variable (never hardcode).
+# Stored as bytes so the JWT library doesn't re-encode it on every encode/decode.
+_secret_key = os.getenv("SECRET_KEY")
+if not _secret_key:
+    raise RuntimeError("SECRET_KEY environment variable is not set")
+SECRET_KEY = _secret_key.encode()
+ALGORITHM = "HS256"
+# Token lifetime: 7 days (in minutes)
+ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7
+
+# Work factor for new bcrypt hashes. 12 is the production default; dev/test can
+# lower it (e.g. BCRYPT_ROUNDS=4) to make signup/login near-instant.
+# Existing hashes keep their own cost, so changing this never breaks logins.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+# -------------------- MongoDB --------------------
+MONGO_URI = os.getenv("MONGO_URI")
+DB_NAME = os.getenv("MONGO_DB", "smartpix")  # default to "smartpix" if not set
+
+# -------------------- OpenAI --------------------
+# In local dev, put OPENAI_API_KEY=... in .env
+# In production (AWS App Runner / ECS), set it in the service environment variables.
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+
+# -------------------- Uploads --------------------
+# Read/write size used when saving uploads to disk (default 1 MiB).
+# Bigger chunks mean fewer syscalls; tune via UPLOAD_CHUNK_SIZE (bytes).
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1 << 20)))
+
+# -------------------- CORS --------------------
+# Comma-separated list of allowed frontend origins (see app.py).
+_env_origins = os.getenv("ALLOWED_ORIGINS")
+ALLOWED_ORIGINS = [o.strip() for o in _env_origins.split(",")] if _env_origins else []
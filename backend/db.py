@@ -1,14 +1,7 @@
 # backend/db.py
-import os
-from dotenv import load_dotenv
 import motor.motor_asyncio
 
-# Load .env file in local development (ignored in production if not present)
-load_dotenv()
-
-# Get MongoDB URI and DB name from environment variables
-MONGO_URI = os.getenv("MONGO_URI")
-DB_NAME = os.getenv("MONGO_DB", "smartpix")  # default to "smartpix" if not set
+from config import MONGO_URI, DB_NAME
 
 if not MONGO_URI:
     raise RuntimeError("MONGO_URI environment variable is not set")
@@ -21,3 +14,15 @@ db = client[DB_NAME]
 users_collection = db["users"]
 images_collection = db["images"]
 edits_collection = db["edits"]
+variations_collection = db["variations"]  # cached OpenAI results, keyed by input hash + settings
+
+
+# Indexes (created once at app startup; see app.py)
+async def ensure_indexes():
+    # Login/signup look users up by email; unique also guards against duplicate signups
+    await users_collection.create_index("email", unique=True)
+    # Dashboard lists a user's images, newest first
+    await images_collection.create_index([("user_id", 1), ("uploaded_at", -1), ("_id", -1)])
+    # Edits are looked up by image (dashboard $lookup) and by image + owner (download);
+    # the compound index serves both since image_id is its prefix
+    await edits_collection.create_index([("image_id", 1), ("user_id", 1)])
@@ -1,15 +1,91 @@
 # backend/utils/image_ai.py
-import openai
-from openai import OpenAI
-import requests
-from PIL import Image  # imported for potential local edits, not currently used
-from io import BytesIO  # imported for potential in-memory handling, not currently used
+from typing import Final
+import functools
+import httpx
+import hashlib
+import shutil
 import os
 
-# API key is loaded from environment (never hardcode!)
-# In local dev, put OPENAI_API_KEY=... in .env
-# In production (AWS App Runner / ECS), set it in the service environment variables.
-openai.api_key = os.getenv("OPENAI_API_KEY")
+# API key is loaded from environment via config (never hardcode!)
+from config import OPENAI_API_KEY
+
+# Chunk size used when streaming generated images to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Timeouts for that download (seconds). Generous read timeout so large images
+# on a slow link still complete; httpx's 5s default is too tight here.
+DOWNLOAD_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Rich, descriptive prompts for each supported edit type
+PROMPTS: Final[dict[str, str]] = {
+    "enhance": (
+        "Apply professional-grade image enhancement with advanced sharpening algorithms, "
+        "noise reduction, and detail amplification. Optimize contrast, brightness, and color "
+        "saturation while preserving natural skin tones and preventing over-processing artifacts."
+    ),
+    "restore": (
+        "Perform comprehensive image restoration using state-of-the-art denoising, deblurring, "
+        "and artifact removal techniques. Reconstruct missing details, eliminate compression "
+        "artifacts, reduce motion blur, and restore original image quality with photorealistic precision."
+    ),
+    "retouch": (
+        "Execute professional portrait retouching with advanced blemish removal, skin smoothing, "
+        "and complexion enhancement. Eliminate imperfections, reduce wrinkles, brighten eyes, "
+        "whiten teeth, and perfect skin texture while maintaining natural appearance."
+    ),
+    "style": (
+        "Transform the image into a masterpiece oil painting with rich textures, vibrant brush "
+        "strokes, and classical artistic techniques. Apply layered paint effects, canvas texture, "
+        "and traditional color palettes while preserving subject recognition."
+    ),
+    "background": (
+        "Perform precision background removal using advanced AI segmentation with sub-pixel accuracy. "
+        "Create clean transparent PNG output with perfect edge detection, hair detail preservation, "
+        "and anti-aliasing for professional compositing results."
+    ),
+}
+
+
+@functools.cache
+def get_openai_client():
+    """
+    Shared OpenAI client, created on first use and reused for every edit so its
+    connection pool (and TLS session) stays warm across requests.
+    The SDK is imported here rather than at module top: it's heavy and only
+    needed once an edit actually runs, so workers start faster.
+    """
+    from openai import OpenAI
+    return OpenAI(api_key=OPENAI_API_KEY)
+
+
+def variation_cache_key(input_path: str, edit_type: str, intensity: int) -> str:
+    """
+    Build the cache key for a processed image: blake2b of the input file
+    plus the edit settings. Same bytes + same settings → same key.
+    """
+    digest = hashlib.blake2b()
+    with open(input_path, "rb") as f:
+        while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return f"{digest.hexdigest()}|{edit_type}|{intensity}"
+
+
+def copy_cached_output(cached_path: str, output_path: str) -> bool:
+    """
+    Reuse a previously processed file for output_path.
+    Hardlinks when possible (no data copied), otherwise copies.
+    Returns False if the cached file no longer exists (e.g. storage was wiped).
+    """
+    try:
+        os.link(cached_path, output_path)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        # Cross-device or filesystem without hardlinks → plain copy
+        try:
+            shutil.copyfile(cached_path, output_path)
+        except FileNotFoundError:
+            return False
+    return True
 
 
 def process_image(input_path: str, output_path: str, edit_type: str, intensity: int):
@@ -22,60 +98,40 @@ def process_image(input_path: str, output_path: str, edit_type: str, intensity:
       intensity: integer used for "strength" (currently unused in the OpenAI call)
     """
 
-    # Rich, descriptive prompts for each supported edit type
-    prompts = {
-        "enhance": (
-            "Apply professional-grade image enhancement with advanced sharpening algorithms, "
-            "noise reduction, and detail amplification. Optimize contrast, brightness, and color "
-            "saturation while preserving natural skin tones and preventing over-processing artifacts."
-        ),
-        "restore": (
-            "Perform comprehensive image restoration using state-of-the-art denoising, deblurring, "
-            "and artifact removal techniques. Reconstruct missing details, eliminate compression "
-            "artifacts, reduce motion blur, and restore original image quality with photorealistic precision."
-        ),
-        "retouch": (
-            "Execute professional portrait retouching with advanced blemish removal, skin smoothing, "
-            "and complexion enhancement. Eliminate imperfections, reduce wrinkles, brighten eyes, "
-            "whiten teeth, and perfect skin texture while maintaining natural appearance."
-        ),
-        "style": (
-            "Transform the image into a masterpiece oil painting with rich textures, vibrant brush "
-            "strokes, and classical artistic techniques. Apply layered paint effects, canvas texture, "
-            "and traditional color palettes while preserving subject recognition."
-        ),
-        "background": (
-            "Perform precision background removal using advanced AI segmentation with sub-pixel accuracy. "
-            "Create clean transparent PNG output with perfect edge detection, hair detail preservation, "
-            "and anti-aliasing for professional compositing results."
-        ),
-    }
-
     # Validate edit type
-    if edit_type not in prompts:
+    if edit_type not in PROMPTS:
         raise ValueError(f"Unsupported edit_type: {edit_type}")
 
-    prompt = prompts[edit_type]  # currently not passed to API (see note below)
+    prompt = PROMPTS[edit_type]  # currently not passed to API (see note below)
 
-    # Create an OpenAI client
-    client = OpenAI()
+    client = get_openai_client()
 
     # For now, the code always uses create_variation (ignores prompt + intensity).
     # You might replace this with client.images.edit() to apply custom prompts,
     # or pass `prompt=prompt` into the request if your API version supports it.
-    response = client.images.create_variation(
-        image=open(input_path, "rb"),
-        n=1,
-        size="512x512"
-    )
+    with open(input_path, "rb") as image_file:
+        response = client.images.create_variation(
+            image=image_file,
+            n=1,
+            size="512x512"
+        )
 
-    # Download the generated image
+    # Stream the generated image straight into output_path
+    # (1 MiB chunks; never holds the whole file in memory)
     image_url = response.data[0].url
-    img_data = requests.get(image_url).content
-
-    # Save it to output_path
-    with open(output_path, "wb") as f:
-        f.write(img_data)
+    try:
+        with httpx.stream("GET", image_url, timeout=DOWNLOAD_TIMEOUT) as r:
+            r.raise_for_status()
+            with open(output_path, "wb") as f:
+                for chunk in r.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+    except BaseException:
+        # Don't leave a truncated/empty file behind in static/processed
+        try:
+            os.remove(output_path)
+        except FileNotFoundError:
+            pass
+        raise
 
     print("Image saved to:", output_path)
     print("Generated image URL:", image_url)
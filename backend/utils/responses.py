@@ -0,0 +1,21 @@
+# backend/utils/responses.py
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class UTCORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that also passes OPT_NAIVE_UTC, keeping FastAPI's default
+    OPT_NON_STR_KEYS | OPT_SERIALIZE_NUMPY options.
+    Only affects datetimes that reach orjson, i.e. when an endpoint returns
+    this response directly (like the dashboard image listing): Mongo's naive
+    UTC datetimes then serialize as e.g. "2025-08-05T12:00:00+00:00".
+    Responses built from plain return values go through jsonable_encoder
+    first, so their datetimes are already naive ISO strings.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+        )
@@ -1,5 +1,8 @@
 # backend/utils/security.py
-from passlib.hash import bcrypt
+import bcrypt
+
+from config import BCRYPT_ROUNDS
+
 
 def hash_password(password: str) -> str:
     """
@@ -8,7 +11,7 @@ def hash_password(password: str) -> str:
     - Bcrypt automatically generates a new random salt each time, so the same
       password will not produce the same hash twice.
     """
-    return bcrypt.hash(password)
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
 
 def verify_password(plain_password: str, hashed: str) -> bool:
@@ -17,4 +20,4 @@ def verify_password(plain_password: str, hashed: str) -> bool:
     - Returns True if the password matches the hash, False otherwise.
     - Use this during login to check the provided password against the stored hash.
     """
-    return bcrypt.verify(plain_password, hashed)
+    return bcrypt.checkpw(plain_password.encode(), hashed.encode())
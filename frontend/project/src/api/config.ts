@@ -0,0 +1,4 @@
+// src/api/config.ts
+// Origin of the backend API. Set VITE_API_BASE_URL in production;
+// image URLs returned by the API are relative to this origin.
+export const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000';
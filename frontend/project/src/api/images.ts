@@ -0,0 +1,34 @@
+// src/api/images.ts
+import { UserImage } from '../types';
+import { API_BASE_URL } from './config';
+
+// Largest page the API accepts (MAX_PAGE_SIZE in backend/api/dashboard.py)
+const PAGE_SIZE = 200;
+
+// Fetch every image for a user, following the API's pagination
+// (?skip=&limit=) until the X-Has-More header says there are no more pages.
+export const fetchAllUserImages = async (
+  userId: string,
+  token?: string
+): Promise<UserImage[]> => {
+  const images: UserImage[] = [];
+  const headers: HeadersInit = token ? { Authorization: `Bearer ${token}` } : {};
+
+  for (let skip = 0; ; skip += PAGE_SIZE) {
+    const res = await fetch(
+      `${API_BASE_URL}/api/user-images/${userId}?skip=${skip}&limit=${PAGE_SIZE}`,
+      { headers }
+    );
+
+    if (!res.ok) {
+      throw new Error('Failed to fetch user images');
+    }
+
+    const page: UserImage[] = await res.json();
+    images.push(...page);
+
+    if (res.headers.get('X-Has-More') !== 'true') {
+      return images;
+    }
+  }
+};
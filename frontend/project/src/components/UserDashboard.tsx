@@ -3,6 +3,8 @@ import React, { useEffect, useState } from 'react';
 import { Clock, Download, Edit2, Trash2 } from 'lucide-react';
 import { UserImage } from '../types';
 import { useAuth } from '../context/AuthContext';
+import { API_BASE_URL } from '../api/config';
+import { fetchAllUserImages } from '../api/images';
 
 interface UserDashboardProps {
   onSelectImage: (image: UserImage) => void;
@@ -25,11 +27,7 @@ const UserDashboard: React.FC<UserDashboardProps> = ({
 
     const fetchImages = async () => {
       try {
-        const res = await fetch(`http://localhost:8000/api/user-images/${user.id}`);
-        if (!res.ok) {
-          throw new Error('Failed to fetch images');
-        }
-        const data = await res.json();
+        const data = await fetchAllUserImages(user.id);
         setImages(data);
       } catch (err) {
         console.error('Error fetching user images:', err);
@@ -80,7 +78,7 @@ const UserDashboard: React.FC<UserDashboardProps> = ({
                 onClick={() => onSelectImage(image)}
               >
                 <img 
-                  src={`${image.originalImageUrl}`} 
+                  src={`${API_BASE_URL}${image.originalImageUrl}`} 
                   alt={image.name}
                   className="w-full h-full object-cover hover:scale-105 transition-transform duration-300"
                 />
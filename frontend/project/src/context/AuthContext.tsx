@@ -5,6 +5,7 @@ import React, {
   useEffect,
   ReactNode,
 } from 'react';
+import { API_BASE_URL } from '../api/config';
 
 interface User {
   email: string;
@@ -33,8 +34,6 @@ interface AuthProviderProps {
   children: ReactNode;
 }
 
-const API_BASE = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000';
-
 const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
   const [user, setUser] = useState<User | null>(null);
   const [loading, setLoading] = useState(true);
@@ -61,7 +60,7 @@ const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
     form.append('username', email);
     form.append('password', password);
 
-    const res = await fetch(`${API_BASE}/api/login`, {
+    const res = await fetch(`${API_BASE_URL}/api/login`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/x-www-form-urlencoded' },
       body: form.toString(),
@@ -78,7 +77,7 @@ const AuthProvider: React.FC<AuthProviderProps> = ({ children }) => {
   };
 
   const signup = async (email: string, password: string): Promise<void> => {
-    const res = await fetch(`${API_BASE}/api/signup`, {
+    const res = await fetch(`${API_BASE_URL}/api/signup`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({ email, password }),
@@ -4,8 +4,8 @@ import { Plus, BarChart2, Image as ImageIcon, RefreshCw } from 'lucide-react';
 import UserDashboard from '../components/UserDashboard';
 import { useAuth } from '../context/AuthContext';
 import { UserImage } from '../types';
-
-const API_BASE_URL = 'http://localhost:8000';
+import { API_BASE_URL } from '../api/config';
+import { fetchAllUserImages } from '../api/images';
 
 const Dashboard: React.FC = () => {
   const [images, setImages] = useState<UserImage[]>([]);
@@ -22,22 +22,13 @@ const Dashboard: React.FC = () => {
     const fetchImages = async () => {
       try {
         setLoading(true);
-        const response = await fetch(`${API_BASE_URL}/api/user-images/${user.id}`, {
-          headers: {
-            Authorization: `Bearer ${user.token}`,
-          },
-        });
-
-        if (!response.ok) {
-          throw new Error('Failed to fetch user images');
-        }
-
-        const data: UserImage[] = await response.json();
+        const data = await fetchAllUserImages(user.id, user.token);
 
         const fullData = data.map(image => ({
           ...image,
-          originalImageUrl: image.originalImageUrl,
-          editedImageUrl: image.editedImageUrl || null,
+          // The API returns paths relative to its own origin
+          originalImageUrl: `${API_BASE_URL}${image.originalImageUrl}`,
+          editedImageUrl: image.editedImageUrl ? `${API_BASE_URL}${image.editedImageUrl}` : null,
         }));
 
         setImages(fullData);